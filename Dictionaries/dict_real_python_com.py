@@ -11,10 +11,32 @@ Konsep yang TIDAK ADA di dokumentasi resmi python dalam hal ini sudah saya imple
 8. Membuat custom dictionary class (inherit dari dict)
 9. .__dict__ attribute pada objek
 10. Membuat dictionary dari dua list dengan zip()
+11. SortedDict: mapping yang tetap terurut (indexable skip list) dengan rank, range, top-k
+12. ShardedCounter: Counter per thread tanpa lock global, digabung saat dibaca
+13. HeavyHitters: Count-Min Sketch + Space-Saving, memori tetap dan bisa di-merge
+14. ColumnarDict: key terurut + value di array bertipe, lookup banyak key sekaligus
 """
 
 from collections import OrderedDict, Counter, defaultdict
+from collections.abc import Mapping, MutableMapping
+import bisect
+import hashlib
+import heapq
+import math
+import random
 import sys
+import threading
+import timeit
+import tracemalloc
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import itemgetter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None   # ColumnarDict.get_many memakai bisect jika NumPy tidak ada
 
 print("=" * 60)
 print("1. MEMBUAT DICTIONARY DENGAN dict.fromkeys()")
@@ -238,6 +260,702 @@ more_cities = ["Jakarta", "Surabaya"]
 city_pop2 = dict(zip(more_cities, populations))
 print(f"zip dengan panjang tidak sama: {city_pop2}")
 
+print("\n" + "=" * 60)
+print("11. SortedDict: TETAP TERURUT TANPA SORT ULANG (SKIP LIST)")
+print("=" * 60)
+
+# SortableDict di bagian 8 menyalin semua item, sort, clear(), lalu update()
+# setiap kali dipanggil: O(n log n) + membangun ulang dict. Untuk leaderboard
+# 2 juta entry yang di-update terus, itu terlalu mahal.
+# Solusinya: indexable skip list. Setiap node menyimpan "lebar" (width) tiap
+# link = berapa item yang dilompati. Dengan width kita bisa mencari posisi
+# ke-i dan rank sebuah item dalam O(log n), dan tetap terurut saat insert.
+
+class _SkipNode:
+    __slots__ = ("item", "next", "width")
+
+    def __init__(self, item, levels):
+        self.item = item
+        self.next = [None] * levels
+        self.width = [1] * levels
+
+
+class IndexableSkipList:
+    """List terurut dengan insert, remove, rank dan akses index O(log n)."""
+
+    MAX_LEVELS = 32   # cukup untuk 2**32 item
+
+    def __init__(self, items=()):
+        self._head = _SkipNode(None, self.MAX_LEVELS)
+        self._size = 0
+        self._levels = 1                 # jumlah level yang sedang terpakai
+        for item in items:
+            self.insert(item)
+
+    def __len__(self):
+        return self._size
+
+    def _predecessors(self, item):
+        """Node terakhir yang < item di setiap level, plus posisi (index) tiap node itu."""
+        chain = [self._head] * self.MAX_LEVELS
+        positions = [-1] * self.MAX_LEVELS
+        node, position = self._head, -1
+        for level in reversed(range(self._levels)):   # hanya level yang terpakai
+            nxt = node.next[level]
+            while nxt is not None and nxt.item < item:
+                position += node.width[level]
+                node, nxt = nxt, nxt.next[level]
+            chain[level], positions[level] = node, position
+        return chain, positions
+
+    def insert(self, item):
+        chain, positions = self._predecessors(item)
+        # Level acak: 1 (50%), 2 (25%), 3 (12.5%), ...
+        levels = min(self.MAX_LEVELS, 1 - int(math.log(1.0 - random.random(), 2)))
+        for level in range(self._levels, levels):
+            self._head.width[level] = self._size + 1   # level baru: head → akhir list
+        self._levels = max(self._levels, levels)
+        new = _SkipNode(item, levels)
+        index = positions[0] + 1                      # posisi item baru
+        for level in range(levels):
+            prev = chain[level]
+            new.next[level], prev.next[level] = prev.next[level], new
+            skipped = index - positions[level]        # jarak prev → item baru
+            new.width[level] = prev.width[level] - skipped + 1
+            prev.width[level] = skipped
+        for level in range(levels, self._levels):
+            chain[level].width[level] += 1
+        self._size += 1
+
+    def remove(self, item):
+        chain, _ = self._predecessors(item)
+        node = chain[0].next[0]
+        if node is None or node.item != item:
+            raise ValueError(f"{item!r} tidak ada di skip list")
+        levels = len(node.next)
+        for level in range(levels):
+            prev = chain[level]
+            prev.width[level] += node.width[level] - 1
+            prev.next[level] = node.next[level]
+        for level in range(levels, self._levels):
+            chain[level].width[level] -= 1
+        self._size -= 1
+
+    def rank(self, item):
+        """Jumlah item yang < item (= index item jika ada)."""
+        return self._predecessors(item)[1][0] + 1
+
+    def _node_at(self, index):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("index di luar jangkauan")
+        node, remaining = self._head, index + 1
+        for level in reversed(range(self._levels)):
+            while node.next[level] is not None and node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.next[level]
+        return node
+
+    def __getitem__(self, index):
+        return self._node_at(index).item
+
+    def iter_from_index(self, index):
+        node = self._node_at(index) if index < self._size else None
+        while node is not None:
+            yield node.item
+            node = node.next[0]
+
+    def iter_from(self, item):
+        """Item >= item secara berurutan (O(log n) untuk menemukan awalnya)."""
+        node = self._predecessors(item)[0][0].next[0]
+        while node is not None:
+            yield node.item
+            node = node.next[0]
+
+    def __iter__(self):
+        return self.iter_from_index(0)
+
+
+class SortedDict(MutableMapping):
+    """
+    Dictionary yang selalu terurut berdasarkan key DAN berdasarkan value.
+    Key dan value harus bisa dibandingkan; value kembar diurutkan per key.
+    """
+
+    def __init__(self, items=()):
+        self._data = {}
+        self._by_key = IndexableSkipList()
+        self._by_value = IndexableSkipList()     # item = (value, key)
+        self.update(items)
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        data = self._data
+        if key in data:
+            old = data[key]
+            if old == value:
+                return
+            self._by_value.remove((old, key))
+        else:
+            self._by_key.insert(key)
+        data[key] = value
+        self._by_value.insert((value, key))
+
+    def __delitem__(self, key):
+        value = self._data.pop(key)
+        self._by_key.remove(key)
+        self._by_value.remove((value, key))
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(self._by_key)          # iterasi selalu urut key
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self.items())})"
+
+    # --- Order statistics: semuanya O(log n) (+ k untuk hasil sepanjang k) ---
+
+    def rank(self, key):
+        """Posisi key dalam urutan key (0 = key terkecil)."""
+        if key not in self._data:
+            raise KeyError(key)
+        return self._by_key.rank(key)
+
+    def rank_by_value(self, key, reverse=True):
+        """Posisi key dalam urutan value; reverse=True → 0 = value terbesar."""
+        position = self._by_value.rank((self._data[key], key))
+        return len(self) - 1 - position if reverse else position
+
+    def key_at(self, index):
+        return self._by_key[index]
+
+    def range_by_key(self, low, high):
+        """Pasangan (key, value) dengan low <= key <= high."""
+        data, result = self._data, []
+        for key in self._by_key.iter_from(low):
+            if key > high:
+                break
+            result.append((key, data[key]))
+        return result
+
+    def range_by_value(self, low, high):
+        """Pasangan (key, value) dengan low <= value <= high, urut value."""
+        result = []
+        for value, key in self._by_value.iter_from((low,)):
+            if value > high:
+                break
+            result.append((key, value))
+        return result
+
+    def top_k(self, k, by="value"):
+        """k item terbesar (leaderboard): by='value' atau by='key'."""
+        index = self._by_value if by == "value" else self._by_key
+        start = max(len(index) - k, 0)
+        tail = list(index.iter_from_index(start))[::-1]
+        if by == "value":
+            return [(key, value) for value, key in tail]
+        return [(key, self._data[key]) for key in tail]
+
+
+leaderboard = SortedDict({"alice": 1200, "bob": 950, "charlie": 1430, "diana": 1100})
+print(f"SortedDict: {leaderboard}  (iterasi urut key)")
+leaderboard["ethan"] = 1300
+leaderboard["bob"] += 500            # update skor: hanya 1 remove + 1 insert
+print(f"Setelah ethan=1300, bob+=500: top_k(3) = {leaderboard.top_k(3)}")
+print(f"rank_by_value('alice') = {leaderboard.rank_by_value('alice')} (0 = juara)")
+print(f"rank('charlie') = {leaderboard.rank('charlie')}, key_at(-1) = {leaderboard.key_at(-1)!r}")
+print(f"range_by_key('b', 'd') = {leaderboard.range_by_key('b', 'd')}")
+print(f"range_by_value(1100, 1300) = {leaderboard.range_by_value(1100, 1300)}")
+print(f"top_k(2, by='key') = {leaderboard.top_k(2, by='key')}")
+
+# Perbandingan: 20.000 pemain, 30 batch x 200 update, lalu ambil top 10
+random.seed(42)
+players = {f"player{i:05d}": random.randint(0, 100_000) for i in range(20_000)}
+batches = [[(f"player{random.randrange(20_000):05d}", random.randint(0, 100_000))
+            for _ in range(200)] for _ in range(30)]
+
+def leaderboard_lama():
+    board = SortableDict(players)
+    for batch in batches:
+        board.update(batch)
+        board.sort_by_values(reverse=True)      # sort ulang seluruh dict
+        top = list(board.items())[:10]
+    return top
+
+def leaderboard_baru():
+    board = SortedDict(players)
+    for batch in batches:
+        board.update(batch)                     # tetap terurut saat update
+        top = board.top_k(10)
+    return top
+
+# Keduanya diukur dengan cara yang sama: build + semua batch
+old_time = timeit.timeit(leaderboard_lama, number=1)
+new_time = timeit.timeit(leaderboard_baru, number=1)
+old_build = timeit.timeit(lambda: SortableDict(players), number=1)
+new_build = timeit.timeit(lambda: SortedDict(players), number=1)
+same = [v for _, v in leaderboard_lama()] == [v for _, v in leaderboard_baru()]
+print(f"\n⏱️ build + 30 batch update + top 10: sort ulang {old_time:.3f}s vs SortedDict {new_time:.3f}s "
+      f"(sama: {same})")
+print(f"   build awal saja: SortableDict {old_build:.3f}s vs SortedDict {new_build:.3f}s")
+print(f"   tanpa build: sort ulang {old_time - old_build:.3f}s vs SortedDict {new_time - new_build:.3f}s")
+print("   (build skip list dibayar sekali; semakin banyak batch, semakin untung SortedDict)")
+
+print("\n" + "=" * 60)
+print("12. ShardedCounter: MENGHITUNG DARI BANYAK THREAD TANPA LOCK GLOBAL")
+print("=" * 60)
+
+# Counter dan defaultdict(int) di bagian 7 hanya untuk satu thread. Jika banyak
+# worker menambah ke SATU Counter, kita perlu lock di setiap increment, dan
+# semua worker jadi antre di lock itu.
+# ShardedCounter: setiap thread punya "shard" (Counter) sendiri lewat
+# threading.local(). Increment hanya menyentuh shard milik thread itu (tanpa
+# lock). Saat dibaca, semua shard dijumlahkan (merge on read).
+
+class ShardedCounter:
+    """Counter thread-safe: shard per thread, digabung saat dibaca."""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards = {}                        # thread → shard (Counter) milik thread itu
+        self._base = Counter()                   # hitungan dari thread yang sudah selesai
+        self._lock = threading.Lock()            # untuk daftar shard, bukan untuk increment
+
+    def _shard(self):
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = Counter()
+            with self._lock:
+                self._fold_finished()
+                self._shards[threading.current_thread()] = shard
+            return shard
+
+    def _fold_finished(self):
+        """Lipat shard thread yang sudah selesai ke _base (dipanggil dengan _lock).
+
+        Thread yang mati tidak menulis lagi, jadi shard-nya aman digabung.
+        Tanpa ini, thread pool yang datang dan pergi membuat _shards terus tumbuh.
+        """
+        finished = [thread for thread in self._shards if not thread.is_alive()]
+        for thread in finished:
+            self._base.update(self._shards.pop(thread))
+
+    def increment(self, key, n=1):
+        self._shard()[key] += n
+
+    def update(self, iterable):
+        """Hitung semua elemen iterable (pakai Counter.update yang ditulis di C)."""
+        self._shard().update(iterable)
+
+    def add_counts(self, counts):
+        """Gabungkan hasil hitungan dari luar, misalnya Counter dari proses worker."""
+        self._shard().update(counts)
+
+    def __getitem__(self, key):
+        with self._lock:
+            self._fold_finished()
+            return self._base[key] + sum(shard[key] for shard in self._shards.values())
+
+    def merged(self):
+        """Snapshot gabungan semua shard sebagai Counter biasa."""
+        with self._lock:
+            self._fold_finished()
+            total = self._base.copy()
+            for shard in self._shards.values():
+                total.update(shard.copy())       # copy: shard bisa berubah saat dibaca
+        return total
+
+    def most_common(self, n=None):
+        """Seperti Counter.most_common: n=None → semua key; selain itu lewat heap, O(m log n)."""
+        return self.merged().most_common(n)
+
+    def total(self):
+        return sum(self.merged().values())
+
+
+random.seed(7)
+vocabulary = ["data", "python", "dict", "counter", "thread", "lock", "shard", "heap"]
+tokens = random.choices(vocabulary, weights=[30, 25, 15, 10, 8, 6, 4, 2], k=400_000)
+chunks = [tokens[i::4] for i in range(4)]              # 4 worker, masing-masing 100.000 token
+
+def count_with_lock(chunks):
+    shared, lock = Counter(), threading.Lock()
+    def worker(chunk):
+        for token in chunk:
+            with lock:                          # setiap increment antre di sini
+                shared[token] += 1
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(worker, chunks))
+    return shared
+
+def count_sharded(chunks, bulk=True):
+    counter = ShardedCounter()
+    def worker(chunk):
+        for token in chunk:
+            counter.increment(token)            # tanpa lock: shard milik thread ini
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(counter.update if bulk else worker, chunks))
+    return counter
+
+sharded = count_sharded(chunks)
+print(f"Jumlah shard (satu per thread yang benar-benar bekerja): {len(sharded._shards)}")
+print(f"sharded['python'] = {sharded['python']}, total = {sharded.total()}")
+print(f"Thread pool sudah selesai, shard-nya dilipat ke satu Counter dasar: "
+      f"{len(sharded._shards)} shard tersisa")
+print(f"most_common(3) = {sharded.most_common(3)}")
+print(f"most_common() tanpa n = semua {len(sharded.most_common())} key, urut terbanyak")
+print(f"Sama dengan Counter biasa? {sharded.merged() == Counter(tokens)}")
+
+# Antar PROSES tidak ada memori bersama: setiap proses menghitung Counter
+# sendiri, mengirimkannya kembali (Counter bisa di-pickle), lalu digabung.
+hasil_worker = [Counter(chunk) for chunk in chunks]    # anggap ini hasil 4 proses
+gabungan = ShardedCounter()
+for hasil in hasil_worker:
+    gabungan.add_counts(hasil)
+print(f"Gabungan hasil 4 'proses': most_common(2) = {gabungan.most_common(2)}")
+
+locked_time = timeit.timeit(lambda: count_with_lock(chunks), number=1)
+single_time = timeit.timeit(lambda: count_sharded(chunks, bulk=False), number=1)
+sharded_time = timeit.timeit(lambda: count_sharded(chunks), number=1)
+print(f"\n⏱️ 400.000 token, 4 thread: Counter + lock {locked_time:.3f}s "
+      f"vs ShardedCounter.increment {single_time:.3f}s vs ShardedCounter.update {sharded_time:.3f}s")
+
+print("\n" + "=" * 60)
+print("13. HeavyHitters: COUNTER PERKIRAAN DENGAN MEMORI TETAP")
+print("=" * 60)
+
+# Counter menyimpan SEMUA key yang pernah muncul. Untuk clickstream dengan
+# ratusan juta URL berbeda, Counter bisa tumbuh sampai puluhan GB.
+# Solusinya: dua struktur dengan ukuran tetap.
+# - Count-Min Sketch: tabel depth x width angka. Setiap key menambah 1 kotak
+#   per baris; perkiraan = nilai terkecil dari kotak-kotaknya. Tidak pernah
+#   terlalu kecil, hanya bisa sedikit terlalu besar (karena tabrakan).
+# - Space-Saving: hanya menyimpan k kandidat key terbanyak. Jika penuh, key
+#   baru menggantikan key dengan hitungan terkecil dan mewarisi hitungannya.
+# Hash memakai blake2b (bukan hash()) agar sama di semua proses, jadi hasil
+# dari banyak worker bisa digabung (merge). Karena itu key dibatasi pada str,
+# bytes dan int, yang bisa diubah menjadi byte dengan cara yang pasti.
+
+class HeavyHitters:
+    """Perkiraan frekuensi dengan memori tetap, API mirip Counter."""
+
+    CHUNK_SIZE = 65_536   # update() menghitung per potongan dulu dengan Counter
+
+    def __init__(self, k=100, width=2**14, depth=4):
+        if width & (width - 1):
+            raise ValueError("width harus pangkat 2")
+        if k < 1:
+            raise ValueError("k minimal 1")
+        self.k = k
+        self.width = width
+        self.depth = depth
+        self._table = array("Q", bytes(8 * width * depth))   # Count-Min Sketch
+        self._candidates = {}                                 # Space-Saving: key → hitungan
+        self._heap = []                                       # (hitungan, key), lazy
+        self._total = 0
+
+    @staticmethod
+    def _key_bytes(key):
+        """Byte dengan tanda tipe: 1 dan "1" beda cell, dan sama di semua proses."""
+        if isinstance(key, str):
+            return b"s" + key.encode("utf-8")
+        if isinstance(key, bytes):
+            return b"b" + key
+        if isinstance(key, int):            # termasuk bool: True == 1, seperti di dict
+            return b"i" + str(int(key)).encode("ascii")
+        # repr() objek biasa berisi alamat memori, berbeda di setiap proses
+        raise TypeError(f"key harus str, bytes atau int, bukan {type(key).__name__}")
+
+    def _cells(self, key):
+        # Dua hash dari satu digest: cell baris i = (h1 + i*h2) % width
+        digest = hashlib.blake2b(self._key_bytes(key), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        mask, width = self.width - 1, self.width
+        return [row * width + ((h1 + row * h2) & mask) for row in range(self.depth)]
+
+    def _prepare(self, pairs):
+        """Cek dan hash SEMUA pasangan dulu: jika ada yang salah, belum ada yang ditulis."""
+        prepared = []
+        for key, count in pairs:
+            if not isinstance(count, int):
+                raise TypeError(f"hitungan harus int, bukan {type(count).__name__}")
+            if count < 0:
+                raise ValueError(f"hitungan tidak boleh negatif: {key!r} → {count}")
+            prepared.append((key, count, self._cells(key)))
+        return prepared
+
+    def _add_all(self, prepared):
+        for key, count, cells in prepared:
+            self._add(key, count, cells)
+
+    def _add(self, key, count, cells):
+        table = self._table
+        for cell in cells:
+            table[cell] += count
+        estimate = min(table[cell] for cell in cells)
+        self._total += count
+        self._offer(key, count, estimate)
+
+    def _offer(self, key, count, estimate):
+        """Space-Saving: perbarui kandidat top-k."""
+        candidates = self._candidates
+        if key in candidates:
+            candidates[key] += count
+        elif len(candidates) < self.k:
+            candidates[key] = count
+        else:
+            smallest_key, smallest = self._pop_smallest()
+            if estimate <= smallest:
+                return                          # jelas bukan heavy hitter
+            del candidates[smallest_key]
+            candidates[key] = smallest + count  # warisi hitungan yang digantikan
+        heapq.heappush(self._heap, (candidates[key], key))
+        if len(self._heap) > 4 * self.k:
+            self._heap = [(c, key) for key, c in candidates.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_smallest(self):
+        heap, candidates = self._heap, self._candidates
+        while True:
+            count, key = heap[0]
+            if candidates.get(key) == count:    # entry heap yang masih berlaku
+                return key, count
+            heapq.heappop(heap)
+
+    def update(self, iterable=(), **kwargs):
+        """Seperti Counter.update(): iterable key, atau mapping key → jumlah.
+
+        Mapping dan kwargs dicek seluruhnya sebelum ada yang ditulis. Iterable
+        dicek per potongan: potongan yang gagal tidak ditulis sama sekali.
+        """
+        if hasattr(iterable, "items"):
+            self._add_all(self._prepare([*iterable.items(), *kwargs.items()]))
+            return
+        pending_kwargs = self._prepare(kwargs.items())
+        iterator = iter(iterable)
+        while True:
+            # Counter (C) merangkum potongan dulu: key yang sering muncul
+            # hanya di-hash sekali per potongan. Memori dibatasi CHUNK_SIZE.
+            chunk = Counter(islice(iterator, self.CHUNK_SIZE))
+            if not chunk:
+                break
+            self._add_all(self._prepare(chunk.items()))
+        self._add_all(pending_kwargs)
+
+    def __getitem__(self, key):
+        """Perkiraan hitungan (tidak pernah lebih kecil dari yang sebenarnya)."""
+        table = self._table
+        estimate = min(table[cell] for cell in self._cells(key))
+        if key in self._candidates:
+            estimate = min(estimate, self._candidates[key])
+        return estimate
+
+    def most_common(self, n=None):
+        ranked = sorted(((key, self[key]) for key in self._candidates),
+                        key=itemgetter(1), reverse=True)
+        return ranked if n is None else ranked[:n]
+
+    def total(self):
+        return self._total
+
+    def merge(self, other):
+        """Gabungkan HeavyHitters lain (misalnya dari worker lain) ke sini."""
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("ukuran sketch harus sama untuk merge")
+        table = self._table
+        for i, value in enumerate(other._table):
+            table[i] += value
+        # Key yang tidak ada di satu sisi bisa saja punya hitungan sampai
+        # minimum sisi itu (jika penuh), jadi minimum itu ditambahkan.
+        floor_self = min(self._candidates.values()) if len(self._candidates) >= self.k else 0
+        floor_other = min(other._candidates.values()) if len(other._candidates) >= other.k else 0
+        combined = {}
+        for key in self._candidates.keys() | other._candidates.keys():
+            combined[key] = (self._candidates.get(key, floor_self)
+                             + other._candidates.get(key, floor_other))
+        top = heapq.nlargest(self.k, combined.items(), key=itemgetter(1))
+        self._candidates = dict(top)
+        self._heap = [(count, key) for key, count in top]
+        heapq.heapify(self._heap)
+        self._total += other._total
+        return self
+
+    def memory_usage(self):
+        return sys.getsizeof(self._table) + sys.getsizeof(self._candidates) + sys.getsizeof(self._heap)
+
+
+# Clickstream buatan: 200.000 klik, sebaran Zipf (sedikit URL sangat populer)
+random.seed(11)
+urls = [f"/produk/{i}" for i in range(50_000)]
+clicks = random.choices(urls, weights=[1 / (i + 1) for i in range(50_000)], k=200_000)
+
+exact = Counter(clicks)
+hh = HeavyHitters(k=20, width=2**12, depth=4)
+hh.update(clicks)
+print(f"Counter exact   : {len(exact):,} key, ~{sys.getsizeof(exact) / 2**20:.1f} MB (dict saja)")
+print(f"HeavyHitters    : ~{hh.memory_usage() / 2**10:.0f} KB, tetap walau key bertambah")
+print(f"Top 3 exact     : {exact.most_common(3)}")
+print(f"Top 3 perkiraan : {hh.most_common(3)}")
+print(f"hh['/produk/9'] = {hh['/produk/9']} (exact {exact['/produk/9']})")
+
+# Dua worker menghitung setengah data masing-masing, lalu digabung
+worker_a, worker_b = HeavyHitters(k=20, width=2**12), HeavyHitters(k=20, width=2**12)
+worker_a.update(clicks[:100_000])
+worker_b.update(clicks[100_000:])
+worker_a.merge(worker_b)
+top10_exact = {key for key, _ in exact.most_common(10)}
+top10_merged = {key for key, _ in worker_a.most_common(10)}
+print(f"Setelah merge 2 worker: total = {worker_a.total():,}, "
+      f"top 10 sama dengan exact: {len(top10_exact & top10_merged)}/10")
+
+print("\n" + "=" * 60)
+print("14. ColumnarDict: dict(zip(keys, values)) DALAM BENTUK KOLOM")
+print("=" * 60)
+
+# dict(zip(cities, populations)) di bagian 10 membuat satu tuple per pasangan,
+# lalu menyimpan setiap key dan value sebagai objek Python + entry hash table.
+# Untuk tabel referensi 50 juta baris itu ~100 byte per entry.
+# ColumnarDict menyimpan dua KOLOM: key terurut (list, atau array jika key
+# berupa angka) dan value di array bertipe. Lookup memakai binary search
+# (bisect), dan lookup banyak key sekaligus memakai NumPy searchsorted.
+
+class ColumnarDict(Mapping):
+    """Mapping read-only: kolom key terurut + kolom value bertipe (array)."""
+
+    def __init__(self, keys, values, value_typecode="q", key_typecode=None):
+        # Dengan NumPy, key bertipe langsung masuk array (tanpa list objek int).
+        # Tanpa NumPy tetap list: sorted() di bawah memakai objek key yang sudah ada.
+        use_numpy = key_typecode and np is not None
+        key_column = array(key_typecode, keys) if use_numpy else list(keys)
+        value_column = array(value_typecode, values)
+        if len(key_column) != len(value_column):
+            raise ValueError("jumlah keys dan values harus sama")
+        self._np_keys = None
+        if use_numpy:
+            self._build_numpy(key_column, value_column)
+            return
+        order = sorted(range(len(key_column)), key=key_column.__getitem__)
+        # Key kembar: seperti dict(zip(...)), value terakhir yang menang.
+        # sorted() stabil, jadi yang terakhir ada di ujung setiap kelompok.
+        # Disaring di tempat (tanpa list index kedua).
+        kept = 0
+        for n, i in enumerate(order):
+            if n + 1 == len(order) or key_column[order[n + 1]] != key_column[i]:
+                order[kept] = i
+                kept += 1
+        del order[kept:]
+        sorted_keys = map(key_column.__getitem__, order)
+        self._keys = array(key_typecode, sorted_keys) if key_typecode else list(sorted_keys)
+        self._values = array(value_typecode, map(value_column.__getitem__, order))
+
+    def _build_numpy(self, key_column, value_column):
+        """Urutkan kolom bertipe dengan np.argsort: satu array index int64, tanpa objek Python."""
+        keys = np.frombuffer(key_column, dtype=key_column.typecode)         # tanpa copy
+        order = np.argsort(keys, kind="stable")    # stabil: value terakhir tetap di ujung
+        sorted_keys = keys[order]
+        last = np.ones(len(order), dtype=bool)     # True = anggota terakhir kelompoknya
+        np.not_equal(sorted_keys[1:], sorted_keys[:-1], out=last[:-1])
+        if not last.all():
+            order, sorted_keys = order[last], sorted_keys[last]
+        del last
+        self._keys = array(key_column.typecode)
+        self._keys.frombytes(memoryview(sorted_keys).cast("B"))   # tanpa bytes perantara
+        del sorted_keys                            # lepas dulu sebelum kolom value dibuat
+        values = np.frombuffer(value_column, dtype=value_column.typecode)[order]
+        self._values = array(value_column.typecode)
+        self._values.frombytes(memoryview(values).cast("B"))
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __iter__(self):
+        return iter(self._keys)                    # urut key
+
+    def _position(self, key):
+        i = bisect.bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            return i
+        return -1
+
+    def __getitem__(self, key):
+        i = self._position(key)
+        if i < 0:
+            raise KeyError(key)
+        return self._values[i]
+
+    def __contains__(self, key):
+        return self._position(key) >= 0
+
+    def get_many(self, keys, default=0):
+        """Value untuk banyak key sekaligus (vektor NumPy jika tersedia)."""
+        if np is None:
+            values, position = self._values, self._position
+            return [values[i] if i >= 0 else default for i in map(position, keys)]
+        if self._np_keys is None:
+            self._np_keys = np.asarray(self._keys)
+        sorted_keys = self._np_keys
+        values = np.frombuffer(self._values, dtype=self._values.typecode)   # tanpa copy
+        query = np.asarray(keys)
+        if not len(sorted_keys):
+            return np.full(len(query), default, dtype=values.dtype)
+        positions = np.minimum(np.searchsorted(sorted_keys, query), len(sorted_keys) - 1)
+        found = sorted_keys[positions] == query
+        return np.where(found, values[positions], default)
+
+    def memory_usage(self):
+        """Byte untuk kedua kolom (ditambah objek key jika disimpan di list)."""
+        total = sys.getsizeof(self._keys) + sys.getsizeof(self._values)
+        if isinstance(self._keys, list):
+            total += sum(map(sys.getsizeof, self._keys))
+        return total
+
+
+city_columns = ColumnarDict(cities, populations)
+print(f"ColumnarDict(cities, populations) = {dict(city_columns.items())}")
+print(f"city_columns['Bandung'] = {city_columns['Bandung']:,}")
+print(f"'Bali' in city_columns = {'Bali' in city_columns}")
+print(f"get_many(['Medan', 'Bali', 'Jakarta']) = "
+      f"{[int(v) for v in city_columns.get_many(['Medan', 'Bali', 'Jakarta'])]}")
+if np is None:
+    print("(NumPy tidak terinstal: get_many memakai bisect per key)")
+
+# Tabel referensi 200.000 baris: id produk (int) → harga
+random.seed(3)
+product_ids = random.sample(range(10**9), 200_000)
+prices = [random.randint(1_000, 5_000_000) for _ in product_ids]
+
+def build_dict():
+    return dict(zip(product_ids, (p + 0 for p in prices)))
+
+def build_columnar():
+    return ColumnarDict(product_ids, prices, value_typecode="q", key_typecode="q")
+
+def traced(build):
+    tracemalloc.start()
+    table = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return table, size
+
+dict_table, dict_bytes = traced(build_dict)
+columnar_table, columnar_bytes = traced(build_columnar)
+print(f"\n200.000 baris: dict ~{dict_bytes / len(product_ids):.0f} byte/entry, "
+      f"ColumnarDict ~{columnar_bytes / len(product_ids):.0f} byte/entry")
+
+queries = random.choices(product_ids, k=100_000) + random.sample(range(10**9), 1_000)
+dict_time = timeit.timeit(lambda: [dict_table.get(q, 0) for q in queries], number=1)
+bulk_time = timeit.timeit(lambda: columnar_table.get_many(queries), number=1)
+same = list(columnar_table.get_many(queries)) == [dict_table.get(q, 0) for q in queries]
+print(f"⏱️ 101.000 lookup: dict.get per key {dict_time:.3f}s vs get_many {bulk_time:.3f}s "
+      f"(hasil sama: {same})")
+
 print("\n" + "=" * 60)
 print("RINGKASAN FITUR REAL PYTHON YANG DITAMBAHKAN")
 print("=" * 60)
@@ -250,4 +968,8 @@ print("- Iterasi dengan unpacking items()")
 print("- collections: OrderedDict, Counter, defaultdict")
 print("- Custom dictionary class (inherit dict)")
 print("- .__dict__ attribute")
-print("- Membuat dictionary dengan zip() dari dua list")
\ No newline at end of file
+print("- Membuat dictionary dengan zip() dari dua list")
+print("- SortedDict (skip list): rank, range dan top-k O(log n) tanpa sort ulang")
+print("- ShardedCounter: shard per thread, merge saat dibaca, shard thread selesai dilipat, most_common(n)")
+print("- HeavyHitters: Count-Min Sketch + Space-Saving untuk top-k dengan memori tetap")
+print("- ColumnarDict: dict dua kolom (key terurut + array value), get_many vektor")
\ No newline at end of file
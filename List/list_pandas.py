@@ -6,11 +6,16 @@ Konsep yang ditambahkan:
 1. Membuat tabel dari dua list menggunakan pandas
 2. Menampilkan list sebagai kolom terstruktur
 3. Alternatif tanpa pandas (loop dan format string) - hanya sebagai perbandingan
+4. print_table cepat: satu format string, satu write, dan mode streaming
 
 PERSYARATAN: pandas harus terinstal. Jika tidak, program akan berhenti.
 """
 
+import io
 import sys
+import timeit
+from contextlib import redirect_stdout
+from itertools import islice
 
 print("=" * 60)
 print("1. DASAR LIST DAN INDEXING (ULANGAN RINGKAS)")
@@ -83,13 +88,66 @@ print("\n" + "=" * 60)
 print("4. MEMBUAT TABEL DENGAN FORMAT MANUAL (SEBAGAI PERBANDINGAN)")
 print("=" * 60)
 
-def print_table(columns, data_dict):
+def print_table(columns, data_dict, file=None):
     """
     Mencetak tabel sederhana dari dictionary list.
     columns: list nama kolom
     data_dict: dictionary dengan key = nama kolom, value = list data
+    file: tujuan output (default: sys.stdout)
     """
-    # Menentukan lebar kolom
+    # Ubah setiap kolom menjadi string SATU kali
+    kolom_teks = [list(map(str, data_dict[col])) for col in columns]
+
+    # Lebar kolom: satu kali max() per kolom (bukan loop bersarang)
+    widths = [max(len(col), max(map(len, teks), default=0)) + 2
+              for col, teks in zip(columns, kolom_teks)]
+
+    # Satu format string untuk semua baris, misal "{:>7}{:>11}"
+    row_format = "".join(f"{{:>{w}}}" for w in widths)
+
+    header = row_format.format(*columns)
+    lines = [header, "-" * len(header)]
+    # map() dengan beberapa iterable = zip tanpa membuat tuple per baris
+    lines.extend(map(row_format.format, *kolom_teks))
+
+    # Satu kali write untuk seluruh tabel
+    (file or sys.stdout).write("\n".join(lines) + "\n")
+
+
+def print_table_stream(columns, rows, widths=None, sample_size=1000,
+                       batch_size=1000, file=None):
+    """
+    Mencetak tabel dari iterator baris (tuple/list) yang terlalu besar
+    untuk disimpan di memori.
+    widths: lebar kolom (tanpa padding); jika None, diperkirakan dari
+            sample_size baris pertama. Nilai yang lebih panjang tetap
+            dicetak utuh, hanya kolomnya jadi tidak rata.
+    batch_size: jumlah baris yang dikumpulkan sebelum satu kali write.
+    """
+    rows = iter(rows)
+    out = file or sys.stdout
+    sample = []
+    if widths is None:
+        sample = [list(map(str, row)) for row in islice(rows, sample_size)]
+        widths = [max(len(col), max((len(row[i]) for row in sample), default=0))
+                  for i, col in enumerate(columns)]
+    row_format = "".join(f"{{:>{w + 2}}}" for w in widths)
+
+    header = row_format.format(*columns)
+    out.write(header + "\n" + "-" * len(header) + "\n")
+    if sample:
+        out.write("\n".join(row_format.format(*row) for row in sample) + "\n")
+
+    # Sisa baris: kumpulkan per batch, lalu satu write per batch
+    while True:
+        batch = [row_format.format(*map(str, row)) for row in islice(rows, batch_size)]
+        if not batch:
+            break
+        out.write("\n".join(batch) + "\n")
+
+
+def print_table_lama(columns, data_dict):
+    """Versi lama (loop bersarang + row += + print per baris), untuk perbandingan."""
     widths = {}
     for col in columns:
         max_len = len(col)
@@ -97,12 +155,10 @@ def print_table(columns, data_dict):
             max_len = max(max_len, len(str(item)))
         widths[col] = max_len + 2
 
-    # Cetak header
     header = "".join(f"{col:>{widths[col]}}" for col in columns)
     print(header)
     print("-" * len(header))
 
-    # Cetak baris
     for i in range(len(data_dict[columns[0]])):
         row = ""
         for col in columns:
@@ -118,6 +174,21 @@ data = {
 print("Hasil print_table() manual:")
 print_table(['color', 'fruit'], data)
 
+print("\nMode streaming dari generator (baris dibuat satu per satu):")
+baris = ((i, color[i % 4], fruit[i % 4]) for i in range(6))
+print_table_stream(['no', 'color', 'fruit'], baris, sample_size=3, batch_size=2)
+print("(lebar diambil dari 3 baris pertama, jadi 'yellow' sedikit keluar kolom)")
+
+# Perbandingan kecepatan: tulis ke StringIO agar layar tidak penuh
+besar = {'angka': list(range(50_000)), 'warna': color * 12_500, 'buah': fruit * 12_500}
+kolom = ['angka', 'warna', 'buah']
+with redirect_stdout(io.StringIO()) as hasil_lama:
+    lama = timeit.timeit(lambda: print_table_lama(kolom, besar), number=1)
+hasil_baru = io.StringIO()
+baru = timeit.timeit(lambda: print_table(kolom, besar, file=hasil_baru), number=1)
+print(f"\n⏱️ 50.000 baris: print_table_lama {lama:.3f}s vs print_table {baru:.3f}s "
+      f"(output sama: {hasil_lama.getvalue() == hasil_baru.getvalue()})")
+
 print("\n" + "=" * 60)
 print("5. MENGGABUNGKAN LIST MENJADI LIST OF DICTIONARIES")
 print("=" * 60)
@@ -343,6 +343,295 @@ print("   New line:\\nSecond line → New line:\n   Second line")
 print("\n💡 Raw strings (r'...') ignore escapes (useful for paths):")
 print(r"   Windows path: C:\Users\Name\Documents")
 
+# ============================================================================
+# SECTION 8: A FASTER TEXT ANALYZER – ONE LOOK AT EVERY CHARACTER
+# ============================================================================
+print("\n\n8. A FASTER TEXT ANALYZER – ONE LOOK AT EVERY CHARACTER")
+print("-" * 40)
+
+print("""text_analyzer() walks over the text SIX times (letters, digits,
+punctuation, whitespace, upper, lower), and each time asks
+'is this character in that string?' – fine for one sentence,
+hopeless for a multi-gigabyte log file.
+
+New plan: a lookup table with 256 boxes, one for every possible byte.
+Each box already says which group the byte belongs to
+(uppercase letter, lowercase letter, digit, punctuation, whitespace...).
+   • Plain Python: bytes.translate() swaps every byte for its group number
+     in one C-speed sweep, then we count each group number.
+   • With NumPy: bincount() counts all 256 byte values in one sweep,
+     and the table folds those 256 counts into groups.
+And instead of printing, we return a TextStats object you can keep.""")
+
+# The code lives in text_stats.py (next to this file): section 10 sends these
+# functions to worker processes, and workers can only run functions they can import.
+from text_stats import TextStats, analyze_text, np
+
+stats = analyze_text(test_sentence)
+print(f"\n📊 analyze_text('{test_sentence}') →")
+stats.report()
+
+if np is None:
+    print("\n(NumPy is not installed – the plain Python translate() path was used.)")
+
+import timeit
+
+big_text = test_sentence * 20000
+slow = timeit.timeit(lambda: [
+    sum(1 for c in big_text if c in string.ascii_letters),
+    sum(1 for c in big_text if c in string.digits),
+    sum(1 for c in big_text if c in string.punctuation),
+    sum(1 for c in big_text if c in string.whitespace),
+    sum(1 for c in big_text if c.isupper()),
+    sum(1 for c in big_text if c.islower()),
+], number=1)
+fast = timeit.timeit(lambda: analyze_text(big_text), number=1)
+print(f"\n⏱️ {len(big_text):,} characters: six passes {slow:.3f}s vs analyze_text {fast:.4f}s")
+
+# ============================================================================
+# SECTION 9: ANALYZING HUGE FILES PIECE BY PIECE
+# ============================================================================
+print("\n\n9. ANALYZING HUGE FILES PIECE BY PIECE")
+print("-" * 40)
+
+print("""A 20 GB log file doesn't fit in memory, so we can't make one big string.
+Instead we read it like eating a pizza: one slice (chunk) at a time,
+count each slice with analyze_text(), and add the TextStats together.
+
+One tricky bit: a word can be cut in half between two slices
+('hel' | 'lo'). So we remember whether the last slice ended in the
+middle of a word; if the next one starts with a letter, it's the SAME
+word and we don't count it twice.
+
+mmap is another way to read: the operating system maps the file into
+memory and loads pages only when we touch them.""")
+
+import io
+import os
+import tempfile
+
+from text_stats import analyze_file
+
+with tempfile.TemporaryDirectory() as folder:
+    log_path = os.path.join(folder, "server.log")
+    with open(log_path, "w", encoding="utf-8") as f:
+        for i in range(1000):
+            f.write(f"2024-06-01 12:00:{i % 60:02d} INFO Request #{i} served in {i % 97}ms ✓\n")
+
+    with open(log_path, "rb") as f:
+        whole = analyze_text(f.read())
+    streamed = analyze_file(log_path, chunk_size=4096)
+    mapped = analyze_file(log_path, chunk_size=4096, use_mmap=True)
+    print(f"\nFile size: {os.path.getsize(log_path):,} bytes, read in 4,096-byte chunks")
+    print(f"   streamed == all at once? {streamed == whole}")
+    print(f"   mmap     == all at once? {mapped == whole}")
+    print(f"   words={streamed.words:,}, characters={streamed.characters:,}, digits={streamed.digits:,}")
+
+# ============================================================================
+# SECTION 10: USING EVERY CPU CORE – PARALLEL ANALYSIS
+# ============================================================================
+print("\n\n10. USING EVERY CPU CORE – PARALLEL ANALYSIS")
+print("-" * 40)
+
+print("""One cook slicing 64 pizzas is slow when 64 cooks are standing around!
+A ProcessPoolExecutor hands out the work to several Python processes:
+   • many files → each worker takes whole files,
+   • one giant file → each worker takes a byte range (0-1GB, 1GB-2GB, ...).
+
+Each worker returns a ShardResult: its TextStats plus two notes –
+'did my range START inside a word?' and 'did it END inside a word?'.
+When we glue the results back together in order, a word cut between two
+ranges is counted once, so the answer is EXACTLY the single-process one.""")
+
+# The workers run _analyze_range() and analyze_file() from text_stats.py.
+from text_stats import analyze_file_parallel, analyze_files_parallel
+
+# Worker processes re-import this script on some systems (Windows, macOS),
+# so the demo only runs in the main process.
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as folder:
+        paths = []
+        for n in range(4):
+            path = os.path.join(folder, f"part{n}.log")
+            with open(path, "w", encoding="utf-8") as f:
+                for i in range(2000):
+                    f.write(f"worker{n} line {i}: status=OK ✓ latency={i % 250}ms\n")
+            paths.append(path)
+
+        per_file = analyze_files_parallel(paths, max_workers=4)
+        combined = sum((stats for _, stats in per_file), TextStats())
+        sequential = sum((analyze_file(p) for p in paths), TextStats())
+        print(f"\n{len(paths)} files on 4 processes: same as one process? {combined == sequential}")
+
+        big_path = paths[0]
+        split = analyze_file_parallel(big_path, max_workers=4, shard_size=5000)
+        print(f"One file cut into {-(-os.path.getsize(big_path) // 5000)} ranges: "
+              f"same as one process? {split == analyze_file(big_path)}")
+        print(f"   words={split.words:,}, characters={split.characters:,}")
+
+# ============================================================================
+# SECTION 11: A REUSABLE TEXT CLEANER FOR MILLIONS OF LINES
+# ============================================================================
+print("\n\n11. A REUSABLE TEXT CLEANER FOR MILLIONS OF LINES")
+print("-" * 40)
+
+print("""In section 3 we built a punctuation-removing table with str.maketrans()
+for ONE sentence. If we build that table again for every line, or decode
+every bytes line into str first, we waste time on every single line.
+
+A TextCleaner builds its tables ONCE (when it's created) – like a
+stencil you cut once and then spray through a thousand times.
+It cleans both str and bytes, and clean_lines() is lazy: it takes an
+iterator of lines (like an open file) and cleans each line only when
+you ask for it.""")
+
+
+class TextCleaner:
+    """Strip punctuation, normalize whitespace and casefold – tables built once."""
+
+    def __init__(self, strip_punctuation=True, normalize_whitespace=True, casefold=True):
+        self.strip_punctuation = strip_punctuation
+        self.normalize_whitespace = normalize_whitespace
+        self.casefold = casefold
+        # str: a table that deletes every punctuation character
+        self._str_table = str.maketrans("", "", string.punctuation) if strip_punctuation else None
+        # bytes: one 256-byte table (A-Z → a-z) plus a set of bytes to delete,
+        # so lowercasing and deleting happen in the SAME translate() call
+        upper = string.ascii_uppercase.encode("ascii")
+        lower = string.ascii_lowercase.encode("ascii")
+        self._bytes_table = bytes.maketrans(upper, lower) if casefold else None
+        self._bytes_delete = string.punctuation.encode("ascii") if strip_punctuation else b""
+
+    def clean_str(self, text):
+        if self._str_table is not None:
+            text = text.translate(self._str_table)
+        if self.casefold:
+            text = text.casefold()
+        if self.normalize_whitespace:
+            text = " ".join(text.split())
+        return text
+
+    def clean_bytes(self, data):
+        """Clean bytes without decoding (casefold only affects ASCII letters)."""
+        if self._bytes_table is not None or self._bytes_delete:
+            data = data.translate(self._bytes_table, self._bytes_delete)
+        if self.normalize_whitespace:
+            data = b" ".join(data.split())
+        return data
+
+    def clean(self, line):
+        return self.clean_bytes(line) if isinstance(line, (bytes, bytearray)) else self.clean_str(line)
+
+    def clean_lines(self, lines):
+        """Lazily clean an iterable of str or bytes lines (e.g. an open file)."""
+        return map(self.clean, lines)
+
+
+cleaner = TextCleaner()
+print(f"\n   str:   {cleaner.clean(sentence)!r}")
+print(f"   bytes: {cleaner.clean(sentence.encode('utf-8'))!r}")
+print(f"   German ß casefolds to ss: {cleaner.clean('STRASSE  Straße!')!r}")
+
+print("\nCleaning a 'file' lazily, line by line:")
+raw_lines = io.BytesIO(b"  Hello,   WORLD!!\n(Python)   is\tGREAT...\n")
+for cleaned in cleaner.clean_lines(raw_lines):
+    print(f"   {cleaned!r}")
+
+many_lines = [f"Line {i}: Hello, World! (Python's GREAT)   \n".encode("utf-8") for i in range(50000)]
+naive = timeit.timeit(lambda: [
+    " ".join(line.decode("utf-8").translate(str.maketrans("", "", string.punctuation)).casefold().split())
+    for line in many_lines
+], number=1)
+fast = timeit.timeit(lambda: list(cleaner.clean_lines(many_lines)), number=1)
+print(f"\n⏱️ 50,000 lines: rebuild table + decode {naive:.3f}s vs TextCleaner on bytes {fast:.3f}s")
+
+# ============================================================================
+# SECTION 12: SAFE PASSWORDS AND TOKENS – FAST AND IN BULK
+# ============================================================================
+print("\n\n12. SAFE PASSWORDS AND TOKENS – FAST AND IN BULK")
+print("-" * 40)
+
+print("""The password in section 3 used random.choice(). Two problems:
+   • 'random' is predictable – fine for games, NOT for passwords.
+     For secrets, use the 'secrets' module (it reads os.urandom).
+   • It calls Python once per character. A million API keys of
+     32 characters = 32 million calls.
+
+The fast and safe way:
+   1. Ask the operating system for a BIG block of random bytes at once.
+   2. Each byte (0-255) picks a character with byte % len(alphabet).
+      But 256 doesn't divide evenly by most alphabet sizes, so the first
+      characters would win a bit more often! We throw away ('reject') the
+      bytes at the top that would cause that bias.
+   3. bytes.translate() does steps 2 for the whole block in C.""")
+
+import secrets
+import threading
+
+
+class TokenGenerator:
+    """Unbiased random tokens from bulk os.urandom() bytes."""
+
+    def __init__(self, alphabet=string.ascii_letters + string.digits, block_size=64 * 1024):
+        if not alphabet.isascii() or len(set(alphabet)) != len(alphabet) or not 2 <= len(alphabet) <= 256:
+            raise ValueError("alphabet must be 2-256 unique ASCII characters")
+        self.alphabet = alphabet
+        self.block_size = block_size
+        size = len(alphabet)
+        limit = 256 - 256 % size          # bytes >= limit would make the choice biased
+        self._table = bytes(ord(alphabet[b % size]) for b in range(256))
+        self._reject = bytes(range(limit, 256))
+        self._pool = b""                  # accepted characters not handed out yet...
+        self._position = 0                # ...starting at this index
+        self._lock = threading.Lock()     # several threads may share one generator
+        self._pid = os.getpid()           # a forked child must not reuse the parent's pool
+
+    def _take(self, count):
+        if os.getpid() != self._pid:
+            # After os.fork() parent and child hold copies of the same pool:
+            # handing it out in both would produce duplicate secrets.
+            # (The lock is replaced too, another thread may have held it.)
+            self._pool, self._position = b"", 0
+            self._lock = threading.Lock()
+            self._pid = os.getpid()
+        with self._lock:
+            start, end = self._position, self._position + count
+            if end > len(self._pool):
+                parts = [self._pool[start:]]
+                available = len(parts[0])
+                while available < count:
+                    block = secrets.token_bytes(max(self.block_size, count - available))
+                    accepted = block.translate(self._table, self._reject)  # map + reject in one go
+                    parts.append(accepted)
+                    available += len(accepted)
+                self._pool = b"".join(parts)
+                start, end = 0, count
+            self._position = end
+            return self._pool[start:end]
+
+    def token(self, length=32):
+        return self._take(length).decode("ascii")
+
+    def generate(self, count, length=32):
+        """Return `count` tokens of `length` characters, drawing entropy in bulk."""
+        text = self._take(count * length).decode("ascii")
+        return [text[i:i + length] for i in range(0, count * length, length)]
+
+
+passwords = TokenGenerator(string.ascii_letters + string.digits + string.punctuation)
+print(f"\n🔐 Secure 12-character password: '{passwords.token(12)}'")
+
+otp = TokenGenerator(string.digits)
+print(f"🔢 Five one-time codes: {otp.generate(5, 6)}")
+
+api_keys = TokenGenerator()
+print(f"🔑 Two API keys: {api_keys.generate(2, 32)}")
+
+slow = timeit.timeit(lambda: [''.join(secrets.choice(characters) for _ in range(32)) for _ in range(10000)],
+                     number=1)
+fast = timeit.timeit(lambda: api_keys.generate(10000, 32), number=1)
+print(f"\n⏱️ 10,000 keys of 32 chars: secrets.choice per char {slow:.3f}s vs TokenGenerator {fast:.4f}s")
+
 # ============================================================================
 # PRACTICE EXERCISES
 # ============================================================================
@@ -409,6 +698,8 @@ print("""
 3. ✨ f-strings are the modern, clean way to embed variables.
 4. 🔒 Strings are immutable – every operation creates a new string.
 5. 🧠 Use f-strings and string methods to write clean, readable code.
+6. ⚡ For big data, look at each byte once: lookup tables, translate(),
+   chunks, and all your CPU cores (sections 8-12).
 
 Remember: Strings are everywhere in programming.
 Master them and you can handle any text! 🚀
@@ -0,0 +1,200 @@
+"""
+Fast text statistics used by String_constants.py (sections 8-10).
+
+They live in their own small module so that the worker processes of
+section 10 import plain functions from here, not from the tutorial script.
+"""
+
+import mmap
+import os
+import string
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from functools import partial
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional – plain Python works everywhere
+    np = None
+
+# Group numbers – every byte belongs to exactly ONE group
+OTHER, UPPER, LOWER, DIGIT, PUNCT, SPACE, CONTINUATION = range(7)
+
+
+def _byte_group(byte):
+    char = chr(byte)
+    if char in string.ascii_uppercase:
+        return UPPER
+    if char in string.ascii_lowercase:
+        return LOWER
+    if char in string.digits:
+        return DIGIT
+    if char in string.punctuation:
+        return PUNCT
+    if char in string.whitespace:
+        return SPACE
+    if 0x80 <= byte <= 0xBF:
+        return CONTINUATION  # middle of a multi-byte UTF-8 character (é, 😊...)
+    return OTHER
+
+
+BYTE_GROUPS = bytes(_byte_group(b) for b in range(256))  # the 256-box lookup table
+GROUP_CODES = [bytes([group]) for group in range(7)]
+SPACE_BYTES = string.whitespace.encode("ascii")
+
+
+@dataclass
+class TextStats:
+    """Counts for a piece of text. Two TextStats can be added together."""
+
+    characters: int = 0
+    words: int = 0
+    letters: int = 0
+    digits: int = 0
+    punctuation: int = 0
+    whitespace: int = 0
+    uppercase: int = 0
+    lowercase: int = 0
+
+    def __add__(self, other):
+        return TextStats(*(getattr(self, f.name) + getattr(other, f.name) for f in fields(self)))
+
+    def report(self):
+        for f in fields(self):
+            print(f"   {f.name.capitalize():12} {getattr(self, f.name):,}")
+
+
+def _stats_from_groups(total_bytes, group_counts, words):
+    return TextStats(
+        characters=total_bytes - group_counts[CONTINUATION],
+        words=words,
+        letters=group_counts[UPPER] + group_counts[LOWER],
+        digits=group_counts[DIGIT],
+        punctuation=group_counts[PUNCT],
+        whitespace=group_counts[SPACE],
+        uppercase=group_counts[UPPER],
+        lowercase=group_counts[LOWER],
+    )
+
+
+def analyze_text(data, use_numpy=True):
+    """Single-pass character statistics for a str or UTF-8 bytes.
+
+    Letters/digits/punctuation/whitespace use the same ASCII sets as
+    text_analyzer(); words are split on string.whitespace. Upper/lowercase
+    count ASCII letters only (text_analyzer also counts letters like 'É').
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if use_numpy and np is not None:
+        values = np.frombuffer(data, dtype=np.uint8)
+        histogram = np.bincount(values, minlength=256)
+        group_counts = np.bincount(np.frombuffer(BYTE_GROUPS, dtype=np.uint8),
+                                   weights=histogram, minlength=7).astype(np.int64).tolist()
+        is_space = (np.frombuffer(BYTE_GROUPS, dtype=np.uint8) == SPACE)[values]
+        # A word starts wherever a non-space byte follows a space (or the start)
+        starts = ~is_space
+        starts[1:] &= is_space[:-1]
+        words = int(np.count_nonzero(starts))
+    else:
+        groups = data.translate(BYTE_GROUPS)
+        group_counts = [groups.count(code) for code in GROUP_CODES]
+        words = len(data.split())  # bytes.split() uses the same 6 whitespace bytes
+    return _stats_from_groups(len(data), group_counts, words)
+
+
+def analyze_chunks(chunks, use_numpy=True):
+    """Add up analyze_text() over byte chunks, fixing words split between chunks."""
+    total = TextStats()
+    inside_word = False     # did the previous chunk end in the middle of a word?
+    for chunk in chunks:
+        if not chunk:
+            continue
+        stats = analyze_text(chunk, use_numpy)
+        if inside_word and chunk[0] not in SPACE_BYTES:
+            stats.words -= 1    # this chunk continues the last chunk's word
+        inside_word = chunk[-1] not in SPACE_BYTES
+        total += stats
+    return total
+
+
+def _read_chunks(file, chunk_size):
+    return iter(lambda: file.read(chunk_size), b"")
+
+
+def _mmap_chunks(file, chunk_size):
+    if os.fstat(file.fileno()).st_size == 0:
+        return   # mmap refuses empty files
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        for start in range(0, len(mapped), chunk_size):
+            yield mapped[start:start + chunk_size]
+
+
+def analyze_file(source, chunk_size=1 << 20, use_mmap=False, use_numpy=True):
+    """Stream statistics for a path or binary file object in bounded memory."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            return analyze_file(file, chunk_size, use_mmap, use_numpy)
+    chunks = _mmap_chunks(source, chunk_size) if use_mmap else _read_chunks(source, chunk_size)
+    return analyze_chunks(chunks, use_numpy)
+
+
+ShardResult = namedtuple("ShardResult", "stats starts_in_word ends_in_word")
+
+
+def _is_word_byte(data):
+    return bool(data) and data[0] not in SPACE_BYTES
+
+
+def _analyze_range(path, start, end, chunk_size=1 << 20, use_numpy=True):
+    """Worker: analyze bytes [start, end) of a file (end > start)."""
+    with open(path, "rb") as file:
+        file.seek(start)
+        starts_in_word = _is_word_byte(file.read(1))
+        file.seek(end - 1)
+        ends_in_word = _is_word_byte(file.read(1))
+
+        def chunks(position=start):
+            file.seek(position)
+            while position < end:
+                chunk = file.read(min(chunk_size, end - position))
+                if not chunk:
+                    break
+                position += len(chunk)
+                yield chunk
+
+        return ShardResult(analyze_chunks(chunks(), use_numpy), starts_in_word, ends_in_word)
+
+
+def merge_shards(shards):
+    """Combine ShardResults of consecutive byte ranges, in order."""
+    total = TextStats()
+    inside_word = False
+    for shard in shards:
+        total += shard.stats
+        if inside_word and shard.starts_in_word:
+            total.words -= 1
+        inside_word = shard.ends_in_word
+    return total
+
+
+def analyze_file_parallel(path, max_workers=None, shard_size=64 << 20, use_numpy=True):
+    """Split one big file into byte ranges and analyze them on several processes."""
+    size = os.path.getsize(path)
+    starts = range(0, size, shard_size)
+    ends = [min(start + shard_size, size) for start in starts]
+    with ProcessPoolExecutor(max_workers) as pool:
+        shards = pool.map(partial(_analyze_range, path, use_numpy=use_numpy), starts, ends)
+        return merge_shards(shards)   # map() keeps the original order
+
+
+def analyze_files_parallel(paths, max_workers=None, use_numpy=True):
+    """Analyze many files on several processes; returns [(path, TextStats), ...] in order.
+
+    A list, not a dict: the same path given twice keeps both entries.
+    """
+    paths = list(paths)
+    with ProcessPoolExecutor(max_workers) as pool:
+        results = pool.map(partial(analyze_file, use_numpy=use_numpy), paths)
+        return list(zip(paths, results))